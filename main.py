@@ -10,6 +10,11 @@ import sys
 import os
 import time
 import json
+import re
+import mmap
+import codecs
+import math
+from collections.abc import Iterable, Iterator
 from glob import glob
 from PyQt6 import QtWidgets, QtCore, QtGui
 from smbus2 import SMBus
@@ -22,24 +27,233 @@ ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(os.path.expanduser("~"), "data")
 # Session-information lægges samme sted så den genskabes korrekt.
 SESSION_FILE = os.path.join(DATA_DIR, "session.json")
+# Senest valgte monospace-font, så fontdatabasen ikke skal gennemsøges ved
+# hver opstart.
+FONT_CACHE_FILE = os.path.join(DATA_DIR, "font_cache.txt")
+# Så mange sekunder går der mindst mellem efterprøvninger af den gemte font
+FONT_CACHE_MAX_AGE = 7 * 24 * 3600
 
 # Hjælpefunktion til at vælge en monospace-font.
 # Programmet forsøger JetBrains Mono først og falder
 # tilbage til Noto Sans Mono eller Iosevka hvis de ikke
 # findes på systemet. Dermed sikres ensartet udseende
 # selv på minimalistiske installationer som Raspberry Pi.
+_mono_font: str | None = None
+_mono_font_scanned = False  # fontdatabasen er gennemsøgt i denne proces
+_note_font: QtGui.QFont | None = None
+# Mapper der vides at findes, så gentagne gemninger ikke stat'er dem
+_known_dirs: set[str] = set()
+
+def _scan_mono_font() -> str:
+    """Find den foretrukne monospace-font i fontdatabasen."""
+    families = QtGui.QFontDatabase.families()
+    for name in ["JetBrains Mono", "Noto Sans Mono", "Iosevka"]:
+        if name in families:
+            return name
+    return QtGui.QFont().defaultFamily()
+
 def pick_mono_font() -> str:
     """Returner navnet på en tilgængelig monospace-font.
 
     QFontDatabase i Qt6 benytter statiske metoder og kræver at der er
     oprettet en QApplication inden den kan benyttes. Vi antager derfor at
     funktionen først kaldes efter ``QApplication`` er initialiseret.
+    Gennemløbet af fontdatabasen er langsomt, så resultatet huskes både i
+    processen og i ``FONT_CACHE_FILE`` til næste opstart. Den gemte font
+    efterprøves bagefter af ``refresh_mono_font_cache``.
     """
-    families = QtGui.QFontDatabase.families()
-    for name in ["JetBrains Mono", "Noto Sans Mono", "Iosevka"]:
-        if name in families:
-            return name
-    return QtGui.QFont().defaultFamily()
+    global _mono_font, _mono_font_scanned
+    if _mono_font is None:
+        try:
+            with open(FONT_CACHE_FILE, "r", encoding="utf-8") as f:
+                _mono_font = f.read().strip() or None
+        except (OSError, UnicodeDecodeError):
+            pass
+        if _mono_font is None:
+            _mono_font = _scan_mono_font()
+            _mono_font_scanned = True
+            _store_mono_font(_mono_font)
+    return _mono_font
+
+def refresh_mono_font_cache() -> None:
+    """Gennemsøg fontdatabasen og ret den gemte font hvis den er forældet.
+
+    Kaldes når vinduet er vist. Gennemløbet sker i GUI-tråden og kan fryse
+    brugerfladen et øjeblik, så det springes over hvis fontdatabasen
+    allerede er gennemsøgt i denne proces, eller hvis cachefilen er nyere
+    end ``FONT_CACHE_MAX_AGE``. En ændring slår først igennem ved næste
+    opstart, så den aktuelle brugerflade ikke skifter font undervejs.
+    """
+    if _mono_font_scanned:
+        return
+    try:
+        if time.time() - os.path.getmtime(FONT_CACHE_FILE) < FONT_CACHE_MAX_AGE:
+            return
+    except OSError:
+        pass
+    # Skrives også når fonten er uændret, så filens alder nulstilles
+    _store_mono_font(_scan_mono_font())
+
+def _store_mono_font(name: str) -> None:
+    try:
+        _ensure_dir(DATA_DIR)
+        _write_text(FONT_CACHE_FILE, name)
+    except OSError:
+        pass  # uden cache gennemsøges fontene blot igen næste gang
+
+def note_font() -> QtGui.QFont:
+    """Returner den delte standardfont til nye faner.
+
+    En ``QFont`` kan ikke oprettes før ``QApplication`` findes, så den
+    bygges ved første kald og genbruges derefter.
+    """
+    global _note_font
+    if _note_font is None:
+        _note_font = QtGui.QFont(pick_mono_font(), 10)
+    return _note_font
+
+def _ensure_dir(path: str) -> None:
+    """Opret mappen ``path`` hvis den mangler.
+
+    Mapper der først er oprettet eller fundet, huskes i ``_known_dirs``, så
+    de løbende gemninger ikke koster et systemkald hver gang.
+    """
+    if path and path not in _known_dirs:
+        os.makedirs(path, exist_ok=True)
+        _known_dirs.add(path)
+
+def _write_text(path: str, text: str, size: int = 1 << 20) -> None:
+    """Skriv tekst til ``path`` atomisk.
+
+    ``QSaveFile`` skriver til en midlertidig fil og omdøber den først når
+    alt er skrevet, så et strømsvigt midt i en gemning aldrig efterlader en
+    halv fil. Teksten kodes og skrives ca. ``size`` tegn ad gangen, så der
+    aldrig ligger en fuld kodet kopi i hukommelsen.
+    """
+    save_file = QtCore.QSaveFile(path)
+    if not save_file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly):
+        # Mappen kan være slettet mens programmet kører, selvom
+        # ``_known_dirs`` husker den. Opret den igen og prøv én gang til.
+        dirpath = os.path.dirname(path)
+        if not dirpath or os.path.isdir(dirpath):
+            raise OSError(save_file.errorString())
+        _known_dirs.discard(dirpath)
+        _ensure_dir(dirpath)
+        if not save_file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly):
+            raise OSError(save_file.errorString())
+    for start in range(0, len(text), size):
+        save_file.write(text[start:start + size].encode("utf-8"))
+    if not save_file.commit():
+        raise OSError(save_file.errorString())
+
+def _normalize_newlines(text: str) -> str:
+    """Omskriv ``\\r\\n`` og ``\\r`` til ``\\n`` som ``open`` i teksttilstand."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+def _read_chunks(path: str, size: int = 1 << 20) -> Iterator[str]:
+    """Læs en UTF-8 tekstfil som en række tekststykker.
+
+    Filen mappes ind i hukommelsen med ``mmap`` og afkodes ``size`` bytes
+    ad gangen med en inkrementel dekoder, så hverken hele filens bytes
+    eller en ekstra kopi af teksten skal ligge i hukommelsen på én gang.
+    Tegn der deles over en stykkegrænse samles korrekt af dekoderen.
+    Linjeskift normaliseres til ``\\n``; et ``\\r`` sidst i et stykke
+    gemmes til det næste, så et ``\\r\\n`` over grænsen ikke bliver til to.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # en tom fil kan ikke mappes
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            carry = ""
+            for start in range(0, len(mm), size):
+                text = decoder.decode(mm[start:start + size])
+                if carry:
+                    text = carry + text
+                carry = "\r" if text.endswith("\r") else ""
+                if carry:
+                    text = text[:-1]
+                if text:
+                    yield _normalize_newlines(text)
+            text = carry + decoder.decode(b"", final=True)
+            if text:
+                yield _normalize_newlines(text)
+
+def _read_pieces(path: str, size: int = 1 << 20) -> list[str]:
+    """Læs en UTF-8 tekstfil som en liste af tekststykker.
+
+    Filer på højst ``size`` bytes læses med et enkelt ``os.read`` og
+    afkodes samlet, uden ``open``-lagets buffere, og linjeskift
+    normaliseres til ``\\n``. Større filer går
+    gennem ``_read_chunks``, så kun ét stykke bytes ligger i hukommelsen
+    ad gangen. Stykkerne samles ikke til én streng; det ville kortvarigt
+    kræve en ekstra kopi af hele teksten.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        length = os.fstat(fd).st_size
+        if length > size:
+            return list(_read_chunks(path, size))
+        parts = []
+        while True:
+            # Filen kan være vokset siden fstat, så læs til slutningen
+            data = os.read(fd, max(length, 1 << 16))
+            if not data:
+                break
+            parts.append(data)
+    finally:
+        os.close(fd)
+    data = parts[0] if len(parts) == 1 else b"".join(parts)
+    return [_normalize_newlines(data.decode("utf-8"))]
+
+def _read_text(path: str) -> str:
+    """Læs en UTF-8 tekstfil i ét hug."""
+    pieces = _read_pieces(path)
+    return pieces[0] if len(pieces) == 1 else "".join(pieces)
+
+def _drain(items: list) -> Iterator:
+    """Gennemløb ``items`` forfra og tøm listen undervejs.
+
+    Hvert element slippes så snart det er leveret, så hukommelsen kan
+    frigives løbende i stedet for først når hele listen er brugt.
+    """
+    items.reverse()
+    while items:
+        yield items.pop()
+
+class FileJobSignals(QtCore.QObject):
+    """Signaler som ``FileJob`` sender tilbage til GUI-tråden."""
+
+    loaded = QtCore.pyqtSignal(str, object)  # sti, liste af tekststykker
+    saved = QtCore.pyqtSignal(str)  # sti
+    failed = QtCore.pyqtSignal(str, str)  # sti, fejlbesked
+
+class FileJob(QtCore.QRunnable):
+    """Læs eller skriv en note i en baggrundstråd.
+
+    På et langsomt SD-kort kan selv små filer tage mærkbar tid, og imens
+    ville brugerfladen fryse. Jobbet udføres derfor i en ``QThreadPool`` og
+    melder resultatet tilbage via ``signals``. Angives ``text`` skrives den
+    til ``path``; ellers læses filen.
+    """
+
+    def __init__(self, path: str, text: str | None = None) -> None:
+        super().__init__()
+        self.path = path
+        self.text = text
+        self.signals = FileJobSignals()
+
+    def run(self) -> None:
+        try:
+            if self.text is None:
+                self.signals.loaded.emit(self.path, _read_pieces(self.path))
+            else:
+                _write_text(self.path, self.text)
+                self.signals.saved.emit(self.path)
+        except (OSError, UnicodeDecodeError) as exc:
+            self.signals.failed.emit(self.path, str(exc))
 
 # ----- UPS HAT overvågning -----
 
@@ -61,8 +275,19 @@ class UPSMonitor:
     REG_CHARGE_TIME_H = 0x2B
     REG_CHARGE_STATE = 0x02
 
-    def __init__(self, bus: int = 1) -> None:
+    def __init__(
+        self, bus: int = 1, poll_interval: float = 30.0, min_interval: float = 10.0
+    ) -> None:
         self.bus_num = bus
+        # Sekunder mellem de faste aflæsninger fra hovedvinduet
+        self.poll_interval = poll_interval
+        # Kald tættere end ``min_interval`` sekunder får sidste resultat
+        # igen, så batteriet ikke læses flere gange i træk.
+        self.min_interval = min_interval
+        self._cache: tuple[int | None, int | None, int | None, bool | None] = (
+            None, None, None, None
+        )
+        self._cache_ts: float | None = None
         try:
             self.bus = SMBus(bus)
         except FileNotFoundError:
@@ -83,25 +308,76 @@ class UPSMonitor:
             raise OSError("Ingen I2C bus")
         return self.bus.read_byte_data(self.ADDRESS, reg)
 
+    def _read_block(self, reg: int, length: int) -> list[int]:
+        """Læs ``length`` på hinanden følgende registre i én transaktion."""
+        if not self.bus:
+            raise OSError("Ingen I2C bus")
+        return self.bus.read_i2c_block_data(self.ADDRESS, reg, length)
+
     def status(
         self,
     ) -> tuple[int | None, int | None, int | None, bool | None]:
         """Returner batteriprocent, afladnings- og opladningstid.
 
         Hvis der opstår en fejl returneres ``(None, None, None, None)``.
+        En vellykket aflæsning genbruges i ``min_interval`` sekunder.
         """
 
+        now = time.monotonic()
+        if self._cache_ts is not None and now - self._cache_ts < self.min_interval:
+            return self._cache
         try:
-            pct = self._read_word(self.REG_PERCENT_L, self.REG_PERCENT_H)
-            dis_mins = self._read_word(self.REG_TIME_L, self.REG_TIME_H)
-            chg_mins = self._read_word(
-                self.REG_CHARGE_TIME_L, self.REG_CHARGE_TIME_H
-            )
+            # Procent og tider ligger samlet i 0x24-0x2B og hentes derfor
+            # i én blok i stedet for seks enkeltlæsninger.
+            data = self._read_block(self.REG_PERCENT_L, 8)
+            pct = (data[1] << 8) | data[0]  # 0x24-0x25
+            dis_mins = (data[5] << 8) | data[4]  # 0x28-0x29
+            chg_mins = (data[7] << 8) | data[6]  # 0x2A-0x2B
             state = self._read_byte(self.REG_CHARGE_STATE)
             charging = bool(state & 0x80)
         except OSError:
             return None, None, None, None
-        return pct, dis_mins, chg_mins, charging
+        self._cache = (pct, dis_mins, chg_mins, charging)
+        self._cache_ts = now
+        return self._cache
+
+class UPSJobSignals(QtCore.QObject):
+    """Signal som ``UPSJob`` sender tilbage til GUI-tråden."""
+
+    finished = QtCore.pyqtSignal(object)  # tuplen fra ``UPSMonitor.status``
+
+class UPSJob(QtCore.QRunnable):
+    """Aflæs UPS HAT'en i en baggrundstråd.
+
+    Hvert I2C-kald tager nogle millisekunder på en Raspberry Pi, og imens
+    ville brugerfladen stå stille. Resultatet meldes tilbage via
+    ``signals``.
+    """
+
+    def __init__(self, monitor: UPSMonitor) -> None:
+        super().__init__()
+        self.monitor = monitor
+        self.signals = UPSJobSignals()
+
+    def run(self) -> None:
+        self.signals.finished.emit(self.monitor.status())
+
+def _utf16_spans(text: str, spans: list) -> list:
+    """Omregn Python-indeks i ``spans`` til Qt's UTF-16-positioner.
+
+    ``re`` tæller tegn, mens ``setFormat`` tæller UTF-16-enheder, hvor
+    tegn uden for BMP (fx emoji) fylder to. Kun linjer med sådanne tegn
+    skal omregnes.
+    """
+    if text.isascii() or max(text) <= "\uffff":
+        return spans
+    offsets = [0]
+    for ch in text:
+        offsets.append(offsets[-1] + (2 if ch > "\uffff" else 1))
+    return [
+        (offsets[start], offsets[start + length] - offsets[start], fmt)
+        for start, length, fmt in spans
+    ]
 
 # Fremhæv Markdown under skrivning
 class MarkdownHighlighter(QtGui.QSyntaxHighlighter):
@@ -111,8 +387,53 @@ class MarkdownHighlighter(QtGui.QSyntaxHighlighter):
     så man kan se hierarkiet uden et separat preview-vindue.
     """
 
-    def __init__(self, parent=None):
+    # Mønstret kompileres én gang for hele klassen i stedet for ved hver
+    # blok, som tidligere kostede en fuld regex-oversættelse pr. tastetryk.
+    # Fed og kursiv samles i ét mønster, så linjen kun skal gennemløbes én
+    # gang. ``lastgroup`` fortæller hvilken del der matchede. Kursiv må ikke
+    # indeholde stjerner, så søgningen fra hver stjerne stopper ved den
+    # næste, og tiden vokser lineært med linjens længde. Overskrifter,
+    # punkter og citater afgøres af linjens begyndelse og kræver ingen regex.
+    INLINE_RE = re.compile(
+        r"(?P<bold>\*\*(?P<bold_text>.+?)\*\*)"
+        r"|(?P<italic>(?<!\*)\*(?P<italic_text>[^\s*](?:[^*]*[^\s*])?)\*(?!\*))"
+    )
+
+    # Skriftstørrelse for overskrift niveau 1-6 i forhold til brødteksten.
+    # Jo færre #, jo større skrift.
+    _SCALES = (2.0, 1.7, 1.5, 1.3, 1.2, 1.1)
+
+    # Ventetid i ms før en bestilt genformatering af hele dokumentet udføres
+    REHIGHLIGHT_DELAY = 30
+    # Blok-tilstande: en Markdown-linje uden for skærmen markeres som
+    # forældet og formateres først når den scrolles frem.
+    STALE_STATE = 0
+    FRESH_STATE = 1
+
+    def __init__(self, parent=None, editor=None):
         super().__init__(parent)
+        # Når highlighteren kender sin editor formateres kun de linjer der
+        # faktisk er synlige. Ellers formateres hele dokumentet som normalt.
+        self._editor = editor
+        self._highlighting_visible = False
+        # Ændringer i teksten kan flytte uformaterede linjer ind i billedet
+        # uden at scrollbaren rører sig (fx når linjer over dem slettes).
+        # Kontrollen udskydes, så den kører efter layoutet er opdateret.
+        self._visible_timer = QtCore.QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(0)
+        self._visible_timer.timeout.connect(self.highlight_visible)
+        if editor is not None:
+            editor.verticalScrollBar().valueChanged.connect(self.highlight_visible)
+            editor.document().contentsChange.connect(self._schedule_visible)
+        # Flere anmodninger om at genformatere hele dokumentet i træk (fx
+        # ved zoom) samles til én gennemgang når der har været ro i
+        # ``REHIGHLIGHT_DELAY`` ms.
+        self._rehighlight_timer = QtCore.QTimer(self)
+        self._rehighlight_timer.setSingleShot(True)
+        self._rehighlight_timer.setInterval(self.REHIGHLIGHT_DELAY)
+        self._rehighlight_timer.timeout.connect(self.rehighlight)
+
         self.bold_format = QtGui.QTextCharFormat()
         self.bold_format.setFontWeight(QtGui.QFont.Weight.Bold)
 
@@ -135,60 +456,197 @@ class MarkdownHighlighter(QtGui.QSyntaxHighlighter):
         self.bullet_format = QtGui.QTextCharFormat()
         self.bullet_format.setForeground(QtGui.QColor("#bbb"))
 
-    def highlightBlock(self, text: str) -> None:
-        # **fed**
-        bold = QtCore.QRegularExpression(r"\*\*(.+?)\*\*")
-        it = bold.globalMatch(text)
-        while it.hasNext():
-            match = it.next()
-            self.setFormat(match.capturedStart(1), match.capturedLength(1), self.bold_format)
-            # farv selve **-markørerne svagt
-            self.setFormat(match.capturedStart(), 2, self.marker_format)
-            self.setFormat(match.capturedEnd() - 2, 2, self.marker_format)
-
-        # *kursiv*
-        italic = QtCore.QRegularExpression(r"(?<!\*)\*(?!\s)(.+?)(?<!\s)\*(?!\*)")
-        it = italic.globalMatch(text)
-        while it.hasNext():
-            match = it.next()
-            self.setFormat(match.capturedStart(1), match.capturedLength(1), self.italic_format)
-            self.setFormat(match.capturedStart(), 1, self.marker_format)
-            self.setFormat(match.capturedEnd() - 1, 1, self.marker_format)
-
-        # overskrifter begynder med et eller flere #
-        heading = QtCore.QRegularExpression(r"^(#{1,6})\s+(.*)")
-        match = heading.match(text)
-        if match.hasMatch():
-            level = len(match.captured(1))
+        # Tomt format der nulstiller resten af en punktlinje
+        self.plain_format = QtGui.QTextCharFormat()
+
+        # Brødtekstens punktstørrelse huskes, så den ikke skal slås op i
+        # dokumentets font for hver overskrift.
+        self._base_pt = None
+        doc = self.document()
+        self.set_base_point_size(doc.defaultFont().pointSizeF() if doc is not None else 10.0)
+
+    def set_base_point_size(self, pt: float) -> None:
+        """Opdater brødtekstens punktstørrelse når editorens font ændres.
+
+        Formaterne for overskrifternes seks niveauer bygges her én gang, så
+        ``highlightBlock`` ikke skal oprette nye formater for hver linje.
+        """
+        if pt == self._base_pt:
+            return
+        self._base_pt = pt
+        formats = []
+        marker_formats = []
+        for scale in self._SCALES:
             fmt = QtGui.QTextCharFormat(self.heading_format)
-            base = self.document().defaultFont().pointSizeF()
-            # Jo færre #, jo større skrift
-            scale = {1: 2.0, 2: 1.7, 3: 1.5, 4: 1.3, 5: 1.2, 6: 1.1}.get(level, 1)
-            fmt.setFontPointSize(base * scale)
-            self.setFormat(0, len(text), fmt)
+            fmt.setFontPointSize(pt * scale)
             # selve #-symbolerne skal følge samme størrelse og vægt, blot i grå
             marker_fmt = QtGui.QTextCharFormat(fmt)
             marker_fmt.setForeground(self.marker_format.foreground())
-            self.setFormat(match.capturedStart(1), level, marker_fmt)
+            formats.append(fmt)
+            marker_formats.append(marker_fmt)
+        self._heading_formats = tuple(formats)
+        self._heading_marker_formats = tuple(marker_formats)
+
+    def schedule_rehighlight(self) -> None:
+        """Bestil en samlet genformatering af hele dokumentet."""
+        self._rehighlight_timer.start()
 
-        bullet = QtCore.QRegularExpression(r"^\s*\*\s+(.*)")
-        match = bullet.match(text)
-        if match.hasMatch():
-            self.setFormat(match.capturedStart(), 1, self.bullet_format)
-            self.setFormat(match.capturedStart(1), len(match.captured(1)), QtGui.QTextCharFormat())
+    def _schedule_visible(self, *_args) -> None:
+        if not self._visible_timer.isActive():
+            self._visible_timer.start()
 
-        quote = QtCore.QRegularExpression(r"^>\s+(.*)")
-        match = quote.match(text)
-        if match.hasMatch():
-            self.setFormat(0, len(text), self.quote_format)
-            self.setFormat(0, 1, self.marker_format)
+    def _visible_range(self) -> tuple[int, int]:
+        """Returner første og sidste bloknummer der kan ses i editoren.
+
+        Antallet af synlige linjer anslås ud fra viewportens højde. Da
+        ombrudte linjer og store overskrifter fylder mere end én linje, er
+        skønnet altid lidt for stort, aldrig for lille.
+        """
+        editor = self._editor
+        first = max(0, editor.firstVisibleBlock().blockNumber())
+        rows = editor.viewport().height() // max(1, editor.fontMetrics().lineSpacing())
+        return first, first + rows + 1
+
+    def highlight_visible(self) -> None:
+        """Formatér de synlige linjer der endnu ikke er formateret."""
+        if self._editor is None or self._highlighting_visible or self.document() is None:
+            return
+        # Formateringen kan ændre dokumentets højde og dermed scrollbaren,
+        # så undgå at blive kaldt rekursivt fra ``valueChanged``.
+        self._highlighting_visible = True
+        try:
+            first, last = self._visible_range()
+            block = self.document().findBlockByNumber(first)
+            for _ in range(last - first + 1):
+                if not block.isValid():
+                    break
+                if block.userState() == self.STALE_STATE:
+                    self.rehighlightBlock(block)
+                block = block.next()
+        finally:
+            self._highlighting_visible = False
+
+    def highlightBlock(self, text: str) -> None:
+        # Linjer uden Markdown-tegn kan ikke matche nogen af mønstrene, så
+        # regex-motoren springes helt over for almindelig prosa. Hvert
+        # mønster køres desuden kun hvis linjen har det tegn det kræver.
+        has_star = "*" in text
+        first = text[:1]
+        if not has_star and first not in ("#", ">"):
+            return
+        if self._editor is not None:
+            start, end = self._visible_range()
+            if not start <= self.currentBlock().blockNumber() <= end:
+                # Uden for skærmen: spring formateringen over indtil linjen
+                # scrolles frem. ``highlight_visible`` tager sig af resten.
+                self.setCurrentBlockState(self.STALE_STATE)
+                return
+            self.setCurrentBlockState(self.FRESH_STATE)
+
+        # Alle formateringer samles først som (start, længde, format) og
+        # lægges derefter på i ét gennemløb. Rækkefølgen bevares, da senere
+        # formater skal overskrive tidligere (fx punktlistens nulstilling).
+        # Positionerne er Python-indeks og omregnes til UTF-16 til sidst.
+        spans = []
+        add = spans.append
+        marker_format = self.marker_format
+
+        # overskrifter: 1-6 # efterfulgt af mellemrum. En overskrift
+        # formaterer hele linjen, så fed og kursiv kan springes over.
+        level = 0
+        if first == "#":
+            level = len(text) - len(text.lstrip("#"))
+            if level <= 6 and text[level:level + 1].isspace():
+                add((0, len(text), self._heading_formats[level - 1]))
+                add((0, level, self._heading_marker_formats[level - 1]))
+            else:
+                level = 0
+
+        if has_star and not level:
+            bold_format = self.bold_format
+            italic_format = self.italic_format
+            finditer = self.INLINE_RE.finditer
+            for match in finditer(text):
+                start, end = match.span()
+                if match.lastgroup == "bold":
+                    # **fed**, med selve **-markørerne farvet svagt
+                    add((start + 2, end - start - 4, bold_format))
+                    add((start, 2, marker_format))
+                    add((end - 2, 2, marker_format))
+                else:
+                    # *kursiv*
+                    add((start + 1, end - start - 2, italic_format))
+                    add((start, 1, marker_format))
+                    add((end - 1, 1, marker_format))
+
+            # punktliste: "* " eventuelt med indrykning foran
+            stripped = text.lstrip()
+            if stripped[:1] == "*":
+                rest = stripped[1:].lstrip()
+                if len(rest) < len(stripped) - 1:
+                    add((0, 1, self.bullet_format))
+                    add((len(text) - len(rest), len(rest), self.plain_format))
+
+        # citat: "> " i starten af linjen
+        if first == ">" and text[1:2].isspace():
+            add((0, len(text), self.quote_format))
+            add((0, 1, marker_format))
+
+        self._apply_spans(_utf16_spans(text, spans))
+
+    def _apply_spans(self, spans: list) -> None:
+        """Læg formaterne på og slå tilstødende stykker med samme format sammen."""
+        set_format = self.setFormat
+        pending = None
+        for start, length, fmt in spans:
+            if length <= 0:
+                continue
+            if pending is not None:
+                p_start, p_length, p_fmt = pending
+                if fmt is p_fmt and p_start <= start <= p_start + p_length:
+                    pending = (p_start, max(p_length, start + length - p_start), p_fmt)
+                    continue
+                set_format(p_start, p_length, p_fmt)
+            pending = (start, length, fmt)
+        if pending is not None:
+            set_format(*pending)
 
 # ----- Hjælpeklasser -----
 
-class NoteTab(QtWidgets.QTextEdit):
-    """En teksteditor der kan blokere sletning i Hemmingway-tilstand."""
+class NoteTab(QtWidgets.QPlainTextEdit):
+    """En teksteditor der kan blokere sletning i Hemmingway-tilstand.
+
+    Noter er ren Markdown-tekst, så editoren bygger på ``QPlainTextEdit``
+    hvis linjebaserede layout holder skrivning og scrolling hurtig selv i
+    meget lange dokumenter. Formateringen klares af ``MarkdownHighlighter``.
+    """
 
     typed = QtCore.pyqtSignal()
+    # Udsendes første gang en fane der venter på sin tekst bliver vist
+    text_requested = QtCore.pyqtSignal()
+    # Udsendes ved ændringer, så vinduet kan planlægge et auto-gem
+    dirtied = QtCore.pyqtSignal()
+    # Taster der blokeres i Hemmingway-tilstand (sletning og bevægelse bagud)
+    BLOCKED_KEYS = frozenset((
+        QtCore.Qt.Key.Key_Backspace,
+        QtCore.Qt.Key.Key_Delete,
+        QtCore.Qt.Key.Key_Left,
+        QtCore.Qt.Key.Key_Up,
+    ))
+    # Mørk baggrund og små marginer i siderne samt tilpassede scrollbars.
+    # Stilarkene er fælles for alle faner og bygges kun én gang.
+    DEFAULT_STYLE = (
+        "background:#121212;color:#e6e6e6;"
+        "QScrollBar{background:#121212;border:none;}"
+        "QScrollBar::handle{background:#555;border-radius:4px;}"
+        "QScrollBar::add-line,QScrollBar::sub-line{width:0;height:0;}"
+        "QScrollBar::add-page,QScrollBar::sub-page{background:none;}"
+    )
+    BLIND_STYLE = DEFAULT_STYLE.replace("color:#e6e6e6", "color:#121212")
+    # Senest så mange ms efter første ændring gemmes noten automatisk
+    AUTO_SAVE_DELAY = 10000
+    # Antal tegn der indsættes ad gangen når en fil indlæses
+    READ_CHUNK = 65536
 
     def __init__(self, file_path: str, parent=None):
         super().__init__(parent)
@@ -198,33 +656,164 @@ class NoteTab(QtWidgets.QTextEdit):
         # skriver tilbage til den gamle sti.
         self.auto_name = True
         self.hemingway = False  # Hvis sand, blokeres sletning og navigation bagud
+        # Highlighteren oprettes først når fanen vises eller redigeres, så
+        # faner der blot indlæses (fx ved genskabt session) ikke formateres.
+        self.highlighter: MarkdownHighlighter | None = None
         # Brug den skrifttype som ``pick_mono_font`` finder. Dermed er vi
         # robuste overfor systemer hvor JetBrains Mono ikke er installeret.
-        self.setFont(QtGui.QFont(pick_mono_font(), 10))
-        # Mørk baggrund og små marginer i siderne samt tilpassede scrollbars
-        self.default_style = (
-            "background:#121212;color:#e6e6e6;"
-            "QScrollBar{background:#121212;border:none;}"
-            "QScrollBar::handle{background:#555;border-radius:4px;}"
-            "QScrollBar::add-line,QScrollBar::sub-line{width:0;height:0;}"
-            "QScrollBar::add-page,QScrollBar::sub-page{background:none;}"
-        )
+        self.setFont(note_font())
+        self.default_style = self.DEFAULT_STYLE
         self.setStyleSheet(self.default_style)
         self.margin = 24
         self.setViewportMargins(self.margin, 0, self.margin, 0)
-        self.highlighter = MarkdownHighlighter(self.document())
-        # Auto-gem hvert 10. sekund
-        self.auto_timer = QtCore.QTimer(self)
-        self.auto_timer.timeout.connect(self.auto_save)
-        self.auto_timer.start(10000)
+        self._loading = False
+        self._awaiting_text = False
+        # Kun Markdown-noter formateres; andre tekstfiler vises som de er
+        self._markdown = not file_path or file_path.endswith(".md")
+        if self._markdown:
+            self.textChanged.connect(self._ensure_highlighter)
+        # Auto-gem kun når noten er ændret. Hver ændring udsender
+        # ``dirtied``; selve timeren deles af alle faner i vinduet. En ny
+        # fane er "beskidt" fra start, så den kan gemmes straks.
+        self._dirty = True
+        # Indtil noten er skrevet eller indlæst første gang, findes den ikke
+        # på disken og skal gemmes, selvom dokumentet ikke er ændret.
+        self._on_disk = False
+        self.document().contentsChange.connect(self._contents_change)
+        # Slår en baggrundsgemning fejl, markeres dokumentet ændret igen
+        self.document().modificationChanged.connect(self._modification_changed)
+
+    def load_text(self, text: str | Iterable[str]) -> None:
+        """Indsæt en indlæst fil i dokumentet i bidder.
+
+        ``text`` kan være hele teksten eller en række stykker fra
+        ``_read_chunks``. En liste (fx fra ``FileJob``) tømmes undervejs,
+        så allerede indsatte stykker kan frigives. Teksten indsættes ``READ_CHUNK`` tegn ad gangen,
+        og mellem bidderne får event-loopet lov at tegne skærmen, så store
+        filer ikke fryser brugerfladen.
+        """
+        if isinstance(text, str):
+            text = (text,)
+        elif isinstance(text, list):
+            text = _drain(text)
+        doc = self.document()
+        # Indlæsningen skal ikke kunne fortrydes med Ctrl+Z
+        doc.setUndoRedoEnabled(False)
+        cursor = QtGui.QTextCursor(doc)
+        chunk = 0
+        self._loading = True
+        # En eksisterende highlighter kobles fra under indlæsningen, så hver
+        # indsat bid ikke udløser formatering. Ved tilkobling formateres
+        # dokumentet én gang (kun de synlige linjer).
+        highlighter = self.highlighter
+        if highlighter is not None:
+            highlighter.setDocument(None)
+        try:
+            for piece in text:
+                start = 0
+                while start < len(piece):
+                    end = start + self.READ_CHUNK
+                    # Et ``\r\n`` er kun ét linjeskift når begge tegn
+                    # indsættes i samme kald, så det må ikke deles
+                    if piece[end - 1:end + 1] == "\r\n":
+                        end += 1
+                    cursor.insertText(piece[start:end])
+                    start = end
+                    chunk += 1
+                    if chunk % 16 == 0:
+                        QtWidgets.QApplication.processEvents(
+                            QtCore.QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents
+                        )
+        finally:
+            self._loading = False
+            doc.setUndoRedoEnabled(True)
+            if highlighter is not None:
+                highlighter.setDocument(doc)
+        # Eventuel tidligere historik må heller ikke kunne fortrydes ind i
+        # den indlæste tekst
+        doc.clearUndoRedoStacks()
+        doc.setModified(False)
+        # Teksten svarer til filen, så der er intet at auto-gemme
+        self._dirty = False
+        self._on_disk = True
+        self.moveCursor(QtGui.QTextCursor.MoveOperation.Start)
+
+    def wait_for_text(self) -> None:
+        """Hold fanen tom og skrivebeskyttet indtil filen er læst ind.
+
+        Fanen markeres samtidig som uændret, så auto-gem aldrig kan
+        overskrive filen med den tomme pladsholder. Første gang fanen
+        vises udsendes ``text_requested``, så filen først læses når den
+        faktisk skal bruges.
+        """
+        self.setReadOnly(True)
+        self._dirty = False
+        self._awaiting_text = True
+
+    def _ensure_highlighter(self) -> None:
+        """Opret Markdown-highlighteren første gang der er brug for den."""
+        if self.highlighter is not None or self._loading or not self._markdown:
+            return
+        self.textChanged.disconnect(self._ensure_highlighter)
+        self.highlighter = MarkdownHighlighter(self.document(), self)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if self._awaiting_text:
+            self._awaiting_text = False
+            self.text_requested.emit()
+        self._ensure_highlighter()
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.Type.FontChange and self.highlighter is not None:
+            # Overskrifternes formater bygges kun om når fonten faktisk
+            # ændres, fx ved zoom, og ikke ved hvert tastetryk.
+            self.highlighter.set_base_point_size(self.font().pointSizeF())
+            self.highlighter.schedule_rehighlight()
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        # Flere linjer kan være kommet til syne
+        if self.highlighter is not None:
+            self.highlighter.highlight_visible()
 
     def set_scale(self, factor: float):
         """Opdater margener efter zoom."""
         m = int(self.margin * factor)
         self.setViewportMargins(m, 0, m, 0)
 
-    def auto_save(self):
-        """Gem indholdet i filen uden notifikation."""
+    def _mark_dirty(self) -> None:
+        if self._loading:
+            return
+        self._dirty = True
+        self.dirtied.emit()
+
+    def _contents_change(self, _position: int, removed: int, added: int) -> None:
+        # Highlighterens formateringer udsender også ``contentsChanged``, fx
+        # ved scroll, men kun rigtige redigeringer tilføjer eller fjerner tegn
+        if removed or added:
+            self._mark_dirty()
+
+    def _modification_changed(self, modified: bool) -> None:
+        if modified:
+            self._mark_dirty()
+
+    def auto_save(self, pool: QtCore.QThreadPool | None = None):
+        """Gem indholdet i filen uden notifikation, hvis det er ændret.
+
+        Dokumentets ``isModified`` bliver falsk igen hvis brugeren fortryder
+        tilbage til det gemte, så en note der er ændret og ført tilbage
+        ikke skrives igen. En ny note (aldrig gemt) skrives altid.
+        Angives ``pool``, skrives et øjebliksbillede af teksten i
+        baggrunden, så et langsomt SD-kort ikke forsinker tastetryk.
+        """
+        if not self._dirty:
+            return
+        doc = self.document()
+        if self._on_disk and not doc.isModified():
+            self._dirty = False
+            return
         if not self.file_path:
             QtWidgets.QMessageBox.warning(
                 self,
@@ -232,34 +821,78 @@ class NoteTab(QtWidgets.QTextEdit):
                 "Ingen filsti angivet til noten, kan ikke auto-gemme.",
             )
             return
-        dirpath = os.path.dirname(self.file_path)
-        if dirpath:
-            os.makedirs(dirpath, exist_ok=True)
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            f.write(self.toPlainText())
+        _ensure_dir(os.path.dirname(self.file_path))
+        if pool is None:
+            _write_text(self.file_path, self.toPlainText())
+        else:
+            job = FileJob(self.file_path, self.toPlainText())
+            job.signals.failed.connect(self._auto_save_failed)
+            pool.start(job)
+        doc.setModified(False)
+        self._dirty = False
+        self._on_disk = True
+
+    def _auto_save_failed(self, _path: str, _error: str) -> None:
+        """Prøv igen ved næste auto-gem når en baggrundsgemning slog fejl."""
+        self.document().setModified(True)
 
     def set_blind(self, blind: bool) -> None:
         """Skjul eller vis teksten i editoren."""
         if blind:
-            style = self.default_style.replace("color:#e6e6e6", "color:#121212")
-            self.setStyleSheet(style)
+            self.setStyleSheet(self.BLIND_STYLE)
         else:
             self.setStyleSheet(self.default_style)
 
     def keyPressEvent(self, event: QtGui.QKeyEvent):
-        if self.hemingway:
-            blocked = [
-                QtCore.Qt.Key.Key_Backspace,
-                QtCore.Qt.Key.Key_Delete,
-                QtCore.Qt.Key.Key_Left,
-                QtCore.Qt.Key.Key_Up,
-            ]
-            if event.key() in blocked:
-                # Bloker sletning og bevægelse bagud
-                return
+        if self.hemingway and event.key() in self.BLOCKED_KEYS:
+            # Bloker sletning og bevægelse bagud
+            return
         super().keyPressEvent(event)
         self.typed.emit()
 
+class Heartbeat(QtCore.QObject):
+    """Fælles sekund-tik for hele programmet.
+
+    I stedet for at hver nedtælling ejer sin egen ``QTimer`` abonnerer de
+    på ``tick`` her. Den underliggende timer er grov (``CoarseTimer``), så
+    styresystemet kan samle vækninger, og den kører kun så længe der er
+    mindst én abonnent.
+    """
+
+    tick = QtCore.pyqtSignal()
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "Heartbeat":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._slots = []
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self.tick)
+
+    def subscribe(self, slot) -> None:
+        """Kald ``slot`` hvert sekund indtil ``unsubscribe``."""
+        if slot in self._slots:
+            return
+        self._slots.append(slot)
+        self.tick.connect(slot)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unsubscribe(self, slot) -> None:
+        if slot not in self._slots:
+            return
+        self._slots.remove(slot)
+        self.tick.disconnect(slot)
+        if not self._slots:
+            self._timer.stop()
+
 class TimerWidget(QtWidgets.QLabel):
     """Viser en nedtælling og udsender et signal når tiden er gået.
 
@@ -267,6 +900,10 @@ class TimerWidget(QtWidgets.QLabel):
     antal sekunder og widgetten opdaterer sig selv hvert sekund via en
     intern ``QTimer``. Når nedtællingen rammer nul, udsendes ``timeout``
     så andre dele af programmet kan reagere.
+
+    Sluttidspunktet holdes på et monotont ur, så opdateringerne kan sættes
+    på pause mens vinduet er skjult uden at nedtællingen går i stå. De
+    sekundvise opdateringer kommer fra den fælles ``Heartbeat``.
     """
     timeout = QtCore.pyqtSignal()  # Signal der udsendes når tiden er gået
 
@@ -276,11 +913,17 @@ class TimerWidget(QtWidgets.QLabel):
         # Gem fontstørrelse og om timeren kører, så stilen kan opdateres
         # uden at miste farven ved zoom.
         self._font_size = 16
+        self._background = None
+        # Færdigformaterede "MM:SS"-tekster for den første time
+        self._labels: dict[int, str] = {}
         self._running = False
         self._duration = 0
         self._remaining = 0
+        self._deadline = 0.0
+        # Vækker nedtællingen ved sluttidspunktet mens displayet er skjult
         self._timer = QtCore.QTimer(self)
-        self._timer.timeout.connect(self._update_time)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._wake)
         # Ekstra timer der får teksten til at blinke når tiden er gået
         self._blink_anim = None
         self._blinking = False
@@ -295,7 +938,7 @@ class TimerWidget(QtWidgets.QLabel):
     @textOpacity.setter
     def textOpacity(self, value: float) -> None:
         self._text_opacity = value
-        self._update_style()
+        self._update_text_color()
 
     def start(self, seconds: int):
         """Start en nedtælling på det angivne antal sekunder."""
@@ -305,38 +948,93 @@ class TimerWidget(QtWidgets.QLabel):
         self.setVisible(True)
         self._duration = seconds
         self._remaining = seconds
+        self._deadline = time.monotonic() + seconds
         self._blinking = False
         self._update_label()
         # Vis at timeren er aktiv med grøn baggrund
         self._running = True
         self._update_style()
-        self._timer.start(1000)  # opdater hvert sekund
+        self.sync_ticking()
+
+    def _stop_ticking(self) -> None:
+        self._timer.stop()
+        Heartbeat.instance().unsubscribe(self._refresh)
 
     def reset(self):
         """Stop og nulstil timeren."""
-        self._timer.stop()
+        # Markér timeren som stoppet før den skjules; ellers genstarter
+        # ``hideEvent`` vækketimeren mod det gamle sluttidspunkt.
+        self._running = False
+        self._blinking = False
+        self._stop_ticking()
         if self._blink_anim:
             self._blink_anim.stop()
         self.hide()
-        # Markér at timeren er stoppet
-        self._running = False
-        self._blinking = False
         self._update_style()
 
-    def _update_time(self):
-        self._remaining -= 1
+    def _ticking_allowed(self) -> bool:
+        """Afgør om displayet kan ses og derfor skal opdateres hvert sekund."""
+        state = QtGui.QGuiApplication.applicationState()
+        hidden = (
+            QtCore.Qt.ApplicationState.ApplicationHidden,
+            QtCore.Qt.ApplicationState.ApplicationSuspended,
+        )
+        return self.isVisible() and not self.window().isMinimized() and state not in hidden
+
+    def sync_ticking(self) -> None:
+        """Vælg mellem sekundvise opdateringer og ét enkelt vækketidspunkt.
+
+        Mens timeren ikke kan ses, erstattes sekund-tikket af en enkelt
+        timeout ved sluttidspunktet, så programmet ikke vækkes unødigt.
+        Når displayet vises igen, genberegnes den resterende tid.
+        """
+        if not self._running:
+            return
+        if self._ticking_allowed():
+            self._timer.stop()
+            Heartbeat.instance().subscribe(self._refresh)
+            self._refresh()
+        else:
+            Heartbeat.instance().unsubscribe(self._refresh)
+            left = max(0.0, self._deadline - time.monotonic())
+            self._timer.start(int(left * 1000))
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self.sync_ticking()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        super().hideEvent(event)
+        self.sync_ticking()
+
+    def _wake(self):
+        self._refresh()
+        if self._running:
+            # Et skjult vækketidspunkt kan ramme lidt før tid
+            self.sync_ticking()
+
+    def _refresh(self):
+        """Genberegn resttiden ud fra sluttidspunktet og opdater teksten."""
+        # Rund op, så nedtællingen aldrig slutter før sluttidspunktet, selvom
+        # det fælles hjerteslag tikker i en anden fase end timeren
+        self._remaining = max(0, math.ceil(self._deadline - time.monotonic()))
         if self._remaining <= 0:
             self._finish()
         else:
             self._update_label()
 
     def _update_label(self):
-        mins, secs = divmod(self._remaining, 60)
-        self.setText(f"{mins:02d}:{secs:02d}")
+        label = self._labels.get(self._remaining)
+        if label is None:
+            mins, secs = divmod(self._remaining, 60)
+            label = f"{mins:02d}:{secs:02d}"
+            if self._remaining <= 3600:
+                self._labels[self._remaining] = label
+        self.setText(label)
 
     def _finish(self):
         """Kaldes når nedtællingen rammer nul."""
-        self._timer.stop()
+        self._stop_ticking()
         self._running = False
         self._remaining = 0
         self._update_label()
@@ -375,21 +1073,35 @@ class TimerWidget(QtWidgets.QLabel):
     def update_font(self, size: int):
         """Opdater fontstørrelsen og bevar farverne."""
         self._font_size = size
-        self._update_style()
+        font = self.font()
+        font.setPointSize(size)
+        self.setFont(font)
 
     def _update_style(self):
-        """Anvend stylesheet afhængigt af om timeren kører."""
+        """Anvend baggrund afhængigt af om timeren kører.
+
+        Stylesheetet indeholder kun baggrund og luft og sættes kun når
+        tilstanden skifter. Skrifttype og tekstfarve ligger i font og
+        palette, så blink-animationen ikke skal parse et nyt stylesheet
+        for hvert billede.
+        """
         if self._blinking:
             bg = "#8b0000"  # mørk rød når tiden er gået
         elif self._running:
             bg = "#556b2f"  # støvet grøn under nedtælling
         else:
             bg = "#121212"
+        if bg != self._background:
+            self._background = bg
+            self.setStyleSheet(f"background:{bg};padding:4px;")
+        self._update_text_color()
+
+    def _update_text_color(self):
         color = QtGui.QColor("#e6e6e6")
         color.setAlphaF(self._text_opacity)
-        self.setStyleSheet(
-            f"background:{bg};color:{color.name(QtGui.QColor.NameFormat.HexArgb)};font-size:{self._font_size}pt; padding:4px;"
-        )
+        palette = self.palette()
+        palette.setColor(QtGui.QPalette.ColorRole.WindowText, color)
+        self.setPalette(palette)
 
 class TimerMenu(QtWidgets.QWidget):
     """En nedfældet menu hvor brugeren vælger timerens længde.
@@ -401,7 +1113,13 @@ class TimerMenu(QtWidgets.QWidget):
 
     changed = QtCore.pyqtSignal(int)
     closed = QtCore.pyqtSignal()
-    presets = [30, 3 * 60, 7 * 60, 11 * 60]
+    # Forudindstillede længder i sekunder med deres knaptekst
+    presets = (
+        (30, "30 sek"),
+        (3 * 60, "3 min"),
+        (7 * 60, "7 min"),
+        (11 * 60, "11 min"),
+    )
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -416,10 +1134,13 @@ class TimerMenu(QtWidgets.QWidget):
             "QPushButton:focus{background:#444;}"
         )
         self.buttons = []
-        for seconds in self.presets:
-            btn = QtWidgets.QPushButton(self._fmt(seconds))
+        for seconds, label in self.presets:
+            btn = QtWidgets.QPushButton(label)
             btn.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
-            btn.clicked.connect(lambda _, s=seconds: self._choose(s))
+            # Knappens længde gemmes på knappen selv, så alle knapper kan
+            # dele én slot i stedet for en lambda hver.
+            btn.setProperty("seconds", seconds)
+            btn.clicked.connect(self._preset_clicked)
             btn.setAutoDefault(True)
             btn.installEventFilter(self)
             self.layout().addWidget(btn)
@@ -439,32 +1160,40 @@ class TimerMenu(QtWidgets.QWidget):
         self.setMaximumHeight(0)
         self.hide()
         self.installEventFilter(self)
+        # Menuens fulde højde beregnes ved første visning og huskes indtil
+        # fonten skifter, så en åbning ikke kræver en ny layoutberegning.
+        self._full_height: int | None = None
+        self._show_anim = QtCore.QPropertyAnimation(self, b"maximumHeight", self)
+        self._show_anim.setDuration(200)
+        self._hide_anim = QtCore.QPropertyAnimation(self, b"maximumHeight", self)
+        self._hide_anim.setDuration(200)
+        self._hide_anim.finished.connect(self._after_hide)
 
     def show_menu(self):
-        """Vis menuen med en let slide-animation."""
+        """Vis menuen med en let slide-animation.
+
+        Menuen bygges kun én gang og genbruges, så et halvt indtastet
+        tidsrum fra sidst den blev lukket med Escape ryddes her.
+        """
+        self.custom_input.clear()
         self.setVisible(True)
         self.raise_()
         if self.parent():
             self.setFixedWidth(int(self.parent().width() * 0.33))
-        end = self.sizeHint().height()
-        anim = QtCore.QPropertyAnimation(self, b"maximumHeight")
-        anim.setStartValue(0)
-        anim.setEndValue(end)
-        anim.setDuration(200)
-        anim.start()
-        self._anim = anim
+        if self._full_height is None:
+            self._full_height = self.sizeHint().height()
+        self._hide_anim.stop()
+        self._show_anim.setStartValue(0)
+        self._show_anim.setEndValue(self._full_height)
+        self._show_anim.start()
         self.buttons[0].setFocus()
 
     def hide_menu(self):
         """Skjul menuen igen med samme animation modsat."""
-        end = self.maximumHeight()
-        anim = QtCore.QPropertyAnimation(self, b"maximumHeight")
-        anim.setStartValue(end)
-        anim.setEndValue(0)
-        anim.setDuration(200)
-        anim.finished.connect(self._after_hide)
-        anim.start()
-        self._anim = anim
+        self._show_anim.stop()
+        self._hide_anim.setStartValue(self.maximumHeight())
+        self._hide_anim.setEndValue(0)
+        self._hide_anim.start()
 
     def _after_hide(self):
         self.setVisible(False)
@@ -494,6 +1223,9 @@ class TimerMenu(QtWidgets.QWidget):
             self.setFixedHeight(h)
             self.setGeometry((self.parent().width() - w) // 2, self.parent().height() - h, w, h)
 
+    def _preset_clicked(self):
+        self._choose(self.sender().property("seconds"))
+
     def _choose(self, seconds: int):
         self.changed.emit(seconds)
         self.custom_input.clear()
@@ -556,13 +1288,11 @@ class TimerMenu(QtWidgets.QWidget):
         self.setFont(font)
         for child in self.findChildren(QtWidgets.QWidget):
             child.setFont(font)
+        self._full_height = None
         if self.isVisible() and self.parent():
             self.setFixedWidth(int(width * 0.33))
-            self.setMaximumHeight(self.sizeHint().height())
-
-    @staticmethod
-    def _fmt(seconds: int) -> str:
-        return f"{seconds // 60 if seconds >= 60 else seconds} {'min' if seconds >= 60 else 'sek'}"
+            self._full_height = self.sizeHint().height()
+            self.setMaximumHeight(self._full_height)
 
 
 class FileMenu(QtWidgets.QWidget):
@@ -1280,6 +2010,10 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
 
         self.timer_widget = TimerWidget()
         self.timer_widget.timeout.connect(self.timer_finished)
+        # Timerens display opdateres ikke mens programmet er skjult
+        QtWidgets.QApplication.instance().applicationStateChanged.connect(
+            lambda _state: self.timer_widget.sync_ticking()
+        )
         top_bar.addWidget(self.timer_widget)
 
         # Menuen til tidsvalg placeres lige under timeren og er skjult som standard
@@ -1292,6 +2026,9 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
 
         # Fanelinje
         self.tabs = QtWidgets.QTabWidget()
+        # Fanernes editorer i samme rækkefølge som fanelinjen, så de kan
+        # gennemløbes uden at spørge ``QTabWidget`` om hver enkelt.
+        self._editors: list[NoteTab] = []
         vlayout.addWidget(self.tabs)
         self._style_tabs()
 
@@ -1340,8 +2077,23 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         self.indicator.setStyleSheet("background:#334d33;")
         self.indicator.setFixedHeight(3)
         self.indicator.raise_()
+        # Animationerne oprettes én gang og genbruges ved hvert skift
+        self._indicator_anim = QtCore.QPropertyAnimation(self.indicator, b"geometry", self)
+        self._indicator_anim.setDuration(200)
+        bar = self.tabs.tabBar()
+        self._tabbar_hide_anim = QtCore.QPropertyAnimation(bar, b"maximumHeight", self)
+        self._tabbar_hide_anim.setDuration(200)
+        self._tabbar_hide_anim.finished.connect(lambda: bar.setVisible(False))
+        self._tabbar_show_anim = QtCore.QPropertyAnimation(bar, b"maximumHeight", self)
+        self._tabbar_show_anim.setDuration(200)
+        self._tabbar_show_anim.finished.connect(
+            lambda: self._move_indicator(self.tabs.currentIndex())
+        )
         self.tabs.currentChanged.connect(self._move_indicator)
         self.tabs.tabBar().installEventFilter(self)
+        # Skjulte faner får først zoom-fonten når de vises
+        self._current_font: QtGui.QFont | None = None
+        self.tabs.currentChanged.connect(self._apply_pending_font)
 
         # Notifikationsbar der glider op
         self.status = NotificationBar()
@@ -1368,19 +2120,27 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         self.battery_label.setStyleSheet("color:#ddd;padding-left:6px;")
         self.status.addPermanentWidget(self.battery_label)
 
+        # Fil-I/O foregår i én baggrundstråd, så gemninger af samme fil
+        # altid udføres i den rækkefølge de blev bestilt
+        self._io_pool = QtCore.QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+
         # Opsæt overvågning af UPS HAT'en
         self.ups = UPSMonitor()
+        self._battery_polling = False  # en aflæsning kører i baggrunden
         self._battery_timer = QtCore.QTimer()
         self._battery_timer.timeout.connect(self.update_battery_status)
-        self._battery_timer.start(30000)  # opdater hvert 30. sekund
+        self._battery_timer.start(int(self.ups.poll_interval * 1000))
         self.update_battery_status()
 
         # Interne tilstande
         self.hemingway = False
-        self.last_timer_trigger = 0
-        self.last_reset = 0
+        # Tidsstempler for dobbelttryk måles på det monotone ur, som ikke
+        # springer når NTP stiller uret efter opstart (Pi har intet RTC).
+        self.last_timer_trigger = 0.0
+        self.last_reset = 0.0
         self.current_duration = 0
-        self.last_save_press = 0
+        self.last_save_press = 0.0
 
         # Skrivepsykologiske tilstande
         self.invisible_enabled = False
@@ -1412,16 +2172,23 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         self.think_timer.timeout.connect(self._think_prompt)
         self.set_think(True)
 
-        self.self_destruct_timer = QtCore.QTimer()
-        self.self_destruct_timer.timeout.connect(self._tick_self_destruct)
         self.self_destruct_seconds = 0
 
+        # Én fælles auto-gem-timer for alle faner. Første ændring starter
+        # den; flere tastetryk flytter den ikke, så der også gemmes under
+        # lange uafbrudte skriveperioder.
+        self._auto_save_timer = QtCore.QTimer(self)
+        self._auto_save_timer.setSingleShot(True)
+        self._auto_save_timer.setInterval(NoteTab.AUTO_SAVE_DELAY)
+        self._auto_save_timer.timeout.connect(self._auto_save_all)
+
         # Load tidligere session eller start med en ny fane
         if not self.load_session():
             self.new_tab()
             self.apply_fixed_scale()
 
         # Gem sessionen løbende så åbne noter gendannes ved genstart
+        self._session_payload: str | None = None  # senest skrevne JSON
         self._session_timer = QtCore.QTimer()
         self._session_timer.timeout.connect(self.save_session)
         self._session_timer.start(10000)
@@ -1465,15 +2232,19 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
             ("F11", self.brightness_down),
             ("Ctrl+Escape", self.power_menu.show_menu),
         ]
+        # Én ``QAction`` pr. handling, også når den har flere genveje. Qt
+        # slår genvejene op i vinduets genvejstabel i stedet for at lade en
+        # ``QShortcut`` pr. tast filtrere alle tastetryk.
         self.shortcuts = []
         for seqs, slot in shortcuts:
             sequences = seqs if isinstance(seqs, (list, tuple)) else [seqs]
-            for seq in sequences:
-                sc = QtGui.QShortcut(QtGui.QKeySequence(seq), self)
-                sc.setContext(QtCore.Qt.ShortcutContext.ApplicationShortcut)
-                sc.setAutoRepeat(False)
-                sc.activated.connect(slot)
-                self.shortcuts.append(sc)
+            action = QtGui.QAction(self)
+            action.setShortcuts([QtGui.QKeySequence(seq) for seq in sequences])
+            action.setShortcutContext(QtCore.Qt.ShortcutContext.ApplicationShortcut)
+            action.setAutoRepeat(False)
+            action.triggered.connect(slot)
+            self.shortcuts.append(action)
+        self.addActions(self.shortcuts)
 
     def set_shortcuts_enabled(self, enabled: bool) -> None:
         """Aktiver eller deaktiver alle globale genveje."""
@@ -1481,8 +2252,18 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
             sc.setEnabled(enabled)
 
     def update_battery_status(self) -> None:
-        """Hent data fra UPS HAT'en og opdater labelen."""
-        pct, dis_mins, chg_mins, charging = self.ups.status()
+        """Start en aflæsning af UPS HAT'en uden at blokere GUI'en."""
+        if self._battery_polling:
+            return
+        self._battery_polling = True
+        job = UPSJob(self.ups)
+        job.signals.finished.connect(self._show_battery_status)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _show_battery_status(self, status: tuple) -> None:
+        """Opdater labelen med resultatet fra ``UPSJob``."""
+        self._battery_polling = False
+        pct, dis_mins, chg_mins, charging = status
         if pct is None:
             self.battery_label.setText("UPS ikke fundet")
             return
@@ -1571,12 +2352,11 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         bar = self.tabs.tabBar()
         rect = bar.tabRect(index)
         end = QtCore.QRect(rect.left(), bar.height() - 3, rect.width(), 3)
-        anim = QtCore.QPropertyAnimation(self.indicator, b"geometry")
-        anim.setDuration(200)
+        anim = self._indicator_anim
+        anim.stop()
         anim.setStartValue(self.indicator.geometry())
         anim.setEndValue(end)
         anim.start()
-        self._indicator_anim = anim
 
     def _indicator_from_bottom(self):
         """Vis bjælken ved at glide op nedefra under den aktive fane."""
@@ -1584,14 +2364,13 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         rect = bar.tabRect(self.tabs.currentIndex())
         end_y = bar.sizeHint().height() - 3
         start_rect = QtCore.QRect(rect.left(), bar.sizeHint().height(), rect.width(), 3)
+        anim = self._indicator_anim
+        anim.stop()
         self.indicator.setGeometry(start_rect)
         self.indicator.show()
-        anim = QtCore.QPropertyAnimation(self.indicator, b"geometry")
-        anim.setDuration(200)
         anim.setStartValue(start_rect)
         anim.setEndValue(QtCore.QRect(rect.left(), end_y, rect.width(), 3))
         anim.start()
-        self._indicator_anim = anim
 
     def current_editor(self) -> NoteTab:
         """Returner det aktive NoteTab-objekt."""
@@ -1601,29 +2380,34 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
 
     def _generate_filename(self) -> str:
         """Lav et tidsstempel-navn i mappen til brugerdata."""
-        os.makedirs(DATA_DIR, exist_ok=True)
+        _ensure_dir(DATA_DIR)
         base = time.strftime("%H%M-%d%m%y")
+        # Én mappelæsning i stedet for et stat-kald pr. forsøg
+        try:
+            existing = set(os.listdir(DATA_DIR))
+        except FileNotFoundError:
+            # Mappen er slettet siden den blev husket i ``_known_dirs``
+            _known_dirs.discard(DATA_DIR)
+            _ensure_dir(DATA_DIR)
+            existing = set()
         name = f"{base}.md"
-        path = os.path.join(DATA_DIR, name)
         counter = 1
-        while os.path.exists(path):
+        while name in existing:
             name = f"{base}-{counter}.md"
-            path = os.path.join(DATA_DIR, name)
             counter += 1
-        return path
+        return os.path.join(DATA_DIR, name)
 
     def new_tab(self):
         """Opretter en ny tom fane med automatisk filnavn."""
         path = self._generate_filename()
         editor = NoteTab(path)
         editor.typed.connect(self._user_typed)
-        index = self.tabs.addTab(editor, os.path.splitext(os.path.basename(path))[0])
+        index = self._add_editor(editor, path)
         self.tabs.setCurrentIndex(index)
         # Flyt indikatorbjælken til den nye fane
         self._move_indicator(index)
         editor.auto_save()  # gem straks
-        editor.setFont(QtGui.QFont(self.font_family, max(6, round(10 * self.scale_factor))))
-        editor.set_scale(self.scale_factor)
+        self._apply_zoom(editor)
         if self.blind_typing and not self.blind_visible:
             editor.set_blind(True)
         self.status.showMessage("Ny note oprettet", 2000)
@@ -1638,7 +2422,7 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
 
     def save_file(self):
         """Gem den aktuelle fane."""
-        now = time.time()
+        now = time.monotonic()
         editor = self.current_editor()
         if now - self.last_save_press < 2:
             self.last_save_press = now
@@ -1646,15 +2430,30 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
             return
         self.last_save_press = now
 
-        path = getattr(editor, "file_path", None)
+        path = editor.file_path
         # Hvis filen stadig har et autogenereret navn ønsker vi at
         # spørge brugeren om et bedre navn første gang der gemmes.
-        if not path or getattr(editor, "auto_name", False):
+        if not path or editor.auto_name:
             self.save_file_as()
             return
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(editor.toPlainText())
-        self.status.showMessage(f"Gemt {path}", 2000)
+        # Uændrede dokumenter ligger allerede på disken
+        if editor.document().isModified():
+            self._save_in_background(editor, path, f"Gemt {path}")
+        else:
+            self.status.showMessage(f"Gemt {path}", 2000)
+
+    def _save_in_background(self, editor: NoteTab, path: str, message: str) -> None:
+        """Gem et øjebliksbillede af editorens tekst uden at blokere GUI'en."""
+        job = FileJob(path, editor.toPlainText())
+        editor.document().setModified(False)
+        job.signals.saved.connect(lambda _path: self.status.showMessage(message, 2000))
+        job.signals.failed.connect(lambda _path, error: self._save_failed(editor, error))
+        self._io_pool.start(job)
+
+    def _save_failed(self, editor: NoteTab, error: str) -> None:
+        """Markér noten som ændret igen når en gemning slog fejl."""
+        editor.document().setModified(True)
+        self.status.showMessage(f"Kunne ikke gemme: {error}", 5000)
 
     def save_file_as(self):
         """Vis eller skjul menuen for at gemme under et nyt navn."""
@@ -1672,38 +2471,63 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         """Håndter resultatet fra filmenuen."""
         if self.file_menu.mode == "open":
             if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    text = f.read()
-                editor = NoteTab(path)
-                editor.typed.connect(self._user_typed)
-                editor.auto_name = False
-                editor.setText(text)
-                editor.setFont(QtGui.QFont(self.font_family, max(6, round(10 * self.scale_factor))))
-                editor.set_scale(self.scale_factor)
-                if getattr(self, "blind_typing", False) and not getattr(self, "blind_visible", False):
-                    editor.set_blind(True)
-                index = self.tabs.addTab(editor, os.path.splitext(os.path.basename(path))[0])
-                self.tabs.setCurrentIndex(index)
-                self._move_indicator(index)
-                self.status.showMessage(f"Åbnede {path}", 2000)
+                # Filen læses i baggrunden og fanen oprettes når teksten er klar
+                job = FileJob(path)
+                job.signals.loaded.connect(self._file_loaded)
+                job.signals.failed.connect(
+                    lambda _path, error: self.status.showMessage(
+                        f"Kunne ikke åbne: {error}", 5000
+                    )
+                )
+                self._io_pool.start(job)
             else:
                 self.status.showMessage("Filen findes ikke", 2000)
         else:  # save
             editor = self.current_editor()
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(editor.toPlainText())
+            self._save_in_background(editor, path, f"Gemt som {path}")
             editor.file_path = path
             editor.auto_name = False
             name = os.path.splitext(os.path.basename(path))[0]
             self.tabs.setTabText(self.tabs.currentIndex(), name)
             self._move_indicator(self.tabs.currentIndex())
-            self.status.showMessage(f"Gemt som {path}", 2000)
+
+    def _file_loaded(self, path: str, text: list[str]) -> None:
+        """Opret en fane til en fil der er læst færdig i baggrunden."""
+        editor = NoteTab(path)
+        editor.typed.connect(self._user_typed)
+        editor.auto_name = False
+        editor.load_text(text)
+        self._apply_zoom(editor)
+        if getattr(self, "blind_typing", False) and not getattr(self, "blind_visible", False):
+            editor.set_blind(True)
+        index = self._add_editor(editor, path)
+        self.tabs.setCurrentIndex(index)
+        self._move_indicator(index)
+        self.status.showMessage(f"Åbnede {path}", 2000)
+
+    def _add_editor(self, editor: NoteTab, path: str) -> int:
+        """Tilføj ``editor`` som ny fane og returner dens indeks."""
+        self._editors.append(editor)
+        editor.dirtied.connect(self._schedule_auto_save)
+        return self.tabs.addTab(editor, os.path.splitext(os.path.basename(path))[0])
+
+    def _schedule_auto_save(self) -> None:
+        if not self._auto_save_timer.isActive():
+            self._auto_save_timer.start()
+
+    def _auto_save_all(self) -> None:
+        """Auto-gem alle ændrede faner i ét gennemløb."""
+        for editor in self._editors:
+            editor.auto_save(self._io_pool)
 
     def close_current_tab(self):
         """Lukker den aktuelle fane."""
         index = self.tabs.currentIndex()
         if index != -1:
+            # Fanen forsvinder fra den fælles auto-gem, så gem den nu
+            self._editors[index].auto_save(self._io_pool)
             self.tabs.removeTab(index)
+            del self._editors[index]
             if self.tabs.count() == 0:
                 self.new_tab()
             self.status.showMessage("Fane lukket", 2000)
@@ -1727,25 +2551,24 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         """Skjul eller vis fanelinjen med slide-animation."""
         bar = self.tabs.tabBar()
         end = bar.sizeHint().height()
-        anim = QtCore.QPropertyAnimation(bar, b"maximumHeight")
+        self._tabbar_hide_anim.stop()
+        self._tabbar_show_anim.stop()
         if bar.isVisible():
+            anim = self._tabbar_hide_anim
             anim.setStartValue(bar.height())
             anim.setEndValue(0)
-            anim.finished.connect(lambda: bar.setVisible(False))
             self.indicator.hide()
             self.status.hide_bar()
             self.status.user_hidden = True
         else:
             bar.setVisible(True)
+            anim = self._tabbar_show_anim
             anim.setStartValue(0)
             anim.setEndValue(end)
             QtCore.QTimer.singleShot(0, self._indicator_from_bottom)
-            anim.finished.connect(lambda: self._move_indicator(self.tabs.currentIndex()))
             self.status.show_bar()
             self.status.user_hidden = False
-        anim.setDuration(200)
         anim.start()
-        self._tabbar_anim = anim
 
     # ----- Sletning af filer -----
 
@@ -1759,7 +2582,7 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
     def _delete_current_file(self):
         """Slet den aktuelle fil og lukk fanen."""
         editor = self.current_editor()
-        path = getattr(editor, "file_path", "")
+        path = editor.file_path
         if path and os.path.exists(path):
             try:
                 os.remove(path)
@@ -1773,8 +2596,7 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         """Vis README-filen i en skrivebeskyttet dialog."""
         path = os.path.join(ROOT_DIR, "README.md")
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                text = f.read()
+            text = _read_text(path)
         except OSError:
             self.status.showMessage("Kunne ikke åbne README", 2000)
             return
@@ -1783,6 +2605,8 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         dlg.setLayout(QtWidgets.QVBoxLayout())
         view = QtWidgets.QPlainTextEdit()
         view.setReadOnly(True)
+        # Skrivebeskyttet visning har ingen brug for fortryd-historik
+        view.setUndoRedoEnabled(False)
         view.setPlainText(text)
         view.setFont(QtGui.QFont(self.font_family, max(6, round(10 * self.scale_factor))))
         view.setStyleSheet("background:#121212;color:#e6e6e6;")
@@ -1793,30 +2617,56 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
     # ----- Fast skalering -----
 
     def apply_fixed_scale(self):
-        """Sæt fast fontstørrelse og layout ud fra ``scale_factor``."""
+        """Sæt fast fontstørrelse og layout ud fra ``scale_factor``.
+
+        Opdateringer af skærmen slås fra mens alle widgets får ny font, så
+        vinduet kun tegnes og lægges ud én gang bagefter. Kun den aktuelle
+        editor får fonten med det samme; skjulte faner får den først når
+        de vises (se ``_apply_pending_font``).
+        """
         font_size = max(6, round(10 * self.scale_factor))
         font = QtGui.QFont(self.font_family, font_size)
-        self.setFont(font)
-        self.tabs.tabBar().setFont(font)
-        self.status.setFont(font)
-        self.timer_menu.update_scale(font, self.width())
-        self.file_menu.update_scale(font, self.width())
-        self.delete_menu.update_scale(font, self.width())
-        self.power_menu.update_scale(font, self.width(), self.height())
-        if hasattr(self.mind_menu, "update_scale"):
-            self.mind_menu.update_scale(font, self.width())
-        self.timer_widget.update_font(int(16 * self.scale_factor))
-        padding = int(4 * self.scale_factor)
-        self._style_tabs(padding)
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
-            editor.setFont(font)
-            editor.set_scale(self.scale_factor)
-            editor.highlighter.rehighlight()
+        self._current_font = font
+        self.setUpdatesEnabled(False)
+        try:
+            self.setFont(font)
+            self.tabs.tabBar().setFont(font)
+            self.status.setFont(font)
+            self.timer_menu.update_scale(font, self.width())
+            self.file_menu.update_scale(font, self.width())
+            self.delete_menu.update_scale(font, self.width())
+            self.power_menu.update_scale(font, self.width(), self.height())
+            if hasattr(self.mind_menu, "update_scale"):
+                self.mind_menu.update_scale(font, self.width())
+            self.timer_widget.update_font(int(16 * self.scale_factor))
+            padding = int(4 * self.scale_factor)
+            self._style_tabs(padding)
+            for editor in self._editors:
+                editor.set_scale(self.scale_factor)
+            self._apply_pending_font(self.tabs.currentIndex())
+        finally:
+            self.setUpdatesEnabled(True)
         QtCore.QTimer.singleShot(
             0, lambda idx=self.tabs.currentIndex(): self._move_indicator(idx)
         )
 
+    def _apply_zoom(self, editor: NoteTab) -> None:
+        """Giv en ny editor den aktuelle zoom-font og margener."""
+        # Før første ``apply_fixed_scale`` findes der ingen zoom-font; den
+        # sætter så selv fonten på den aktuelle fane.
+        if self._current_font is not None:
+            editor.setFont(self._current_font)
+        editor.set_scale(self.scale_factor)
+
+    def _apply_pending_font(self, index: int) -> None:
+        """Giv fanen ``index`` den aktuelle zoom-font, hvis den mangler."""
+        editor = self.tabs.widget(index)
+        if editor is None or self._current_font is None:
+            return
+        if editor.font() != self._current_font:
+            # Highlighteren følger selv med via ``NoteTab.changeEvent``
+            editor.setFont(self._current_font)
+
     # ----- Timerfunktioner -----
 
     def toggle_timer(self):
@@ -1837,7 +2687,7 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
 
     def reset_or_stop_timer(self):
         """Resetter timeren eller stopper den ved dobbelttryk."""
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_reset < 2:
             self.timer_widget.reset()
             self.status.showMessage("Timer stoppet", 2000)
@@ -1852,6 +2702,12 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         """Vis besked når tiden er gået."""
         self.status.showMessage("Tiden er gået", 5000)
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.WindowStateChange:
+            # Minimeret vindue: sæt timerens sekund-tik på pause
+            self.timer_widget.sync_ticking()
+        super().changeEvent(event)
+
     # ----- Lysstyrke -----
 
     def _brightness_path(self) -> str | None:
@@ -1909,8 +2765,7 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         self._apply_blind()
 
     def _apply_blind(self):
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
+        for editor in self._editors:
             editor.set_blind(self.blind_typing and not self.blind_visible)
 
     def set_think(self, state: bool) -> None:
@@ -1924,7 +2779,7 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         if minutes <= 0:
             return
         self.self_destruct_seconds = minutes * 60
-        self.self_destruct_timer.start(1000)
+        Heartbeat.instance().subscribe(self._tick_self_destruct)
         self.status.showMessage(f"Selvdestruktion om {minutes} min", 2000)
 
     def _tick_self_destruct(self) -> None:
@@ -1934,9 +2789,12 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         if self.self_destruct_seconds == 60:
             self.status.showMessage("Selvdestruktion om 1 minut", 2000)
         if self.self_destruct_seconds <= 0:
-            for i in range(self.tabs.count()):
-                self.tabs.widget(i).clear()
-            self.self_destruct_timer.stop()
+            for editor in self._editors:
+                editor.clear()
+                # ``clear`` nulstiller også "ændret"-flaget, men den tomme
+                # note skal stadig skrives til disken af auto-gem.
+                editor.document().setModified(True)
+            Heartbeat.instance().unsubscribe(self._tick_self_destruct)
             self.status.showMessage("Alt slettet", 5000)
 
     def _start_fade(self):
@@ -2026,8 +2884,7 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
 
     def set_hemingway(self, state: bool) -> None:
         self.hemingway = state
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
+        for editor in self._editors:
             editor.hemingway = state
         self.hemi_label.setVisible(state)
         self.mind_menu.hemi_cb.blockSignals(True)
@@ -2044,6 +2901,8 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         self.save_session()
+        # Vent på gemninger der stadig kører i baggrunden
+        self._io_pool.waitForDone()
         super().closeEvent(event)
 
     def save_session(self):
@@ -2054,21 +2913,22 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         opstart kan ``load_session`` bruge disse oplysninger til at
         genskabe arbejdsfladen.
         """
-        os.makedirs(DATA_DIR, exist_ok=True)
-        files: list[str] = []
-        for i in range(self.tabs.count()):
-            w = self.tabs.widget(i)
-            path = getattr(w, "file_path", None)
-            if path:
-                files.append(path)
+        files = [editor.file_path for editor in self._editors if editor.file_path]
         data = {
             "files": files,
             "current": self.tabs.currentIndex(),
             "size": [self.width(), self.height()],
             "pos": [self.x(), self.y()],
         }
-        with open(SESSION_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        payload = json.dumps(data, separators=(",", ":"))
+        # Sessionen gemmes løbende; er intet ændret siden sidst, skrives der
+        # ikke til SD-kortet.
+        if payload == self._session_payload:
+            return
+        # Atomisk som noterne, så et strømsvigt ikke efterlader en halv session
+        _ensure_dir(DATA_DIR)
+        _write_text(SESSION_FILE, payload)
+        self._session_payload = payload
 
     def load_session(self) -> bool:
         """Forsøg at genskabe en tidligere session.
@@ -2085,17 +2945,30 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
             return False
         files = data.get("files", [])
         loaded = False
+        # Én mappelæsning pr. mappe i stedet for et stat-kald pr. fil
+        listings: dict[str, set[str]] = {}
         for path in files:
-            if path and os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    text = f.read()
+            if not path:
+                continue
+            dirpath, name = os.path.split(path)
+            if dirpath not in listings:
+                try:
+                    listings[dirpath] = set(os.listdir(dirpath or "."))
+                except OSError:
+                    listings[dirpath] = set()
+            if name in listings[dirpath]:
+                # Fanerne bygges straks, men en fil læses først (i
+                # baggrunden) når dens fane vises første gang.
                 editor = NoteTab(path)
                 editor.typed.connect(self._user_typed)
                 editor.auto_name = False
-                editor.setText(text)
+                editor.wait_for_text()
+                editor.text_requested.connect(
+                    lambda ed=editor: self._read_session_file(ed)
+                )
                 if getattr(self, "blind_typing", False) and not getattr(self, "blind_visible", False):
                     editor.set_blind(True)
-                self.tabs.addTab(editor, os.path.splitext(os.path.basename(path))[0])
+                self._add_editor(editor, path)
                 loaded = True
         if not loaded:
             return False
@@ -2110,6 +2983,36 @@ class NotatorMainWindow(QtWidgets.QMainWindow):
         self._move_indicator(self.tabs.currentIndex())
         return True
 
+    def _read_session_file(self, editor: NoteTab) -> None:
+        """Læs en genskabt fanes fil i baggrunden."""
+        job = FileJob(editor.file_path)
+        job.signals.loaded.connect(
+            lambda _path, text: self._session_file_loaded(editor, text)
+        )
+        job.signals.failed.connect(
+            lambda _path, error: self._session_file_failed(editor, error)
+        )
+        self._io_pool.start(job)
+
+    def _session_file_loaded(self, editor: NoteTab, text: list[str]) -> None:
+        """Indsæt teksten i en genskabt fane når baggrundslæsningen er færdig."""
+        if editor not in self._editors:
+            return  # fanen er lukket i mellemtiden
+        editor.load_text(text)
+        editor.setReadOnly(False)
+
+    def _session_file_failed(self, editor: NoteTab, error: str) -> None:
+        """Fjern en genskabt fane hvis filen ikke kunne læses."""
+        if editor not in self._editors:
+            return
+        index = self._editors.index(editor)
+        self.tabs.removeTab(index)
+        del self._editors[index]
+        if self.tabs.count() == 0:
+            self.new_tab()
+        self._move_indicator(self.tabs.currentIndex())
+        self.status.showMessage(f"Kunne ikke åbne: {error}", 5000)
+
 # ----- Programstart -----
 
 def main():
@@ -2127,6 +3030,8 @@ def main():
     )
     window = NotatorMainWindow()
     window.showFullScreen()
+    # Efterprøv den gemte font når brugerfladen er oppe
+    QtCore.QTimer.singleShot(0, refresh_mono_font_cache)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+# Testene kører uden skærm og må ikke røre brugerens rigtige ~/data
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6 import QtWidgets  # noqa: E402
+
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Peg programmets datamappe på en midlertidig mappe.
+
+    Bruges af alle test, da selv en ny ``NoteTab`` gemmer fontcachen.
+    Den valgte font nulstilles, så hver test starter uden cache.
+    """
+    path = tmp_path / "data"
+    monkeypatch.setattr(main, "DATA_DIR", str(path))
+    monkeypatch.setattr(main, "SESSION_FILE", str(path / "session.json"))
+    monkeypatch.setattr(main, "FONT_CACHE_FILE", str(path / "font_cache.txt"))
+    monkeypatch.setattr(main, "_mono_font", None)
+    monkeypatch.setattr(main, "_mono_font_scanned", False)
+    monkeypatch.setattr(main, "_note_font", None)
+    main._known_dirs.clear()
+    yield path
+    main._known_dirs.clear()
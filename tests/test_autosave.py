@@ -0,0 +1,61 @@
+import os
+import shutil
+
+from PyQt6 import QtTest
+
+import main
+
+
+def test_self_destruct_wipes_note_on_disk(qapp, data_dir):
+    window = main.NotatorMainWindow()
+    editor = window.current_editor()
+    editor.insertPlainText("hemmelig tekst")
+    editor.auto_save()
+    with open(editor.file_path, encoding="utf-8") as f:
+        assert f.read() == "hemmelig tekst"
+
+    window.self_destruct_seconds = 1
+    window._tick_self_destruct()
+    window._auto_save_all()
+    window._io_pool.waitForDone()
+
+    with open(editor.file_path, encoding="utf-8") as f:
+        assert f.read() == ""
+    window.close()
+
+
+def test_data_dir_recreated_after_removal(qapp, data_dir):
+    window = main.NotatorMainWindow()
+    editor = window.current_editor()
+    assert str(data_dir) in main._known_dirs
+
+    shutil.rmtree(data_dir)
+    window.new_tab()
+    editor = window.current_editor()
+    editor.insertPlainText("igen")
+    editor.auto_save()
+    window.save_session()
+
+    with open(editor.file_path, encoding="utf-8") as f:
+        assert f.read() == "igen"
+    assert os.path.exists(main.SESSION_FILE)
+    window.close()
+
+
+def test_formatting_does_not_dirty_note(qapp, data_dir):
+    editor = main.NoteTab(str(data_dir / "note.md"))
+    editor.resize(400, 200)
+    editor.load_text("".join(f"# Overskrift {i}\n*tekst*\n" for i in range(300)))
+    dirtied = []
+    editor.dirtied.connect(lambda: dirtied.append(True))
+
+    editor.show()
+    QtTest.QTest.qWait(50)
+    editor.verticalScrollBar().setValue(200)
+    QtTest.QTest.qWait(50)
+    assert not editor._dirty
+    assert not dirtied
+
+    editor.insertPlainText("x")
+    assert editor._dirty
+    assert dirtied
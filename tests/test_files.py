@@ -0,0 +1,46 @@
+import main
+
+
+def test_large_file_is_read_in_pieces(qapp, tmp_path):
+    path = tmp_path / "stor.md"
+    text = "æøå linje ✓\n" * 200000  # godt over 1 MiB
+    path.write_text(text, encoding="utf-8")
+
+    pieces = main._read_pieces(str(path))
+    assert len(pieces) > 1
+    assert "".join(pieces) == text
+    assert main._read_text(str(path)) == text
+
+
+def test_session_file_is_fed_to_editor_in_pieces(qapp, tmp_path):
+    path = tmp_path / "stor.md"
+    text = "# Note\n" + "tekst *x*\n" * 200000
+    path.write_text(text, encoding="utf-8")
+    editor = main.NoteTab(str(path))
+    received = []
+
+    job = main.FileJob(str(path))
+    job.signals.loaded.connect(lambda _path, pieces: received.append(pieces))
+    job.run()
+
+    pieces = received[0]
+    assert isinstance(pieces, list) and len(pieces) > 1
+    editor.load_text(pieces)
+    assert pieces == []  # stykkerne er sluppet efterhånden
+    assert editor.toPlainText() == text
+    assert not editor.document().isModified()
+
+
+def test_crlf_across_piece_boundary_is_one_line_break(qapp, tmp_path):
+    path = tmp_path / "crlf.txt"
+    path.write_bytes(b"x\r\n" * 3000)
+
+    pieces = main._read_pieces(str(path), size=1001)  # stykke 1 slutter med \r
+    assert len(pieces) > 1
+    assert "".join(pieces) == "x\n" * 3000
+
+    editor = main.NoteTab(str(path))
+    editor.READ_CHUNK = 1001  # hver bid slutter med et \r
+    editor.load_text("x\r\n" * 3000)
+    assert editor.document().blockCount() == 3001
+    assert editor.toPlainText() == "x\n" * 3000
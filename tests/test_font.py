@@ -0,0 +1,36 @@
+import os
+import time
+
+import main
+
+
+def _count_scans(monkeypatch):
+    scans = []
+    monkeypatch.setattr(main, "_scan_mono_font", lambda: scans.append(1) or "Mono")
+    return scans
+
+
+def test_cold_start_scans_fonts_once(qapp, data_dir, monkeypatch):
+    scans = _count_scans(monkeypatch)
+
+    assert main.pick_mono_font() == "Mono"
+    main.refresh_mono_font_cache()
+    assert len(scans) == 1
+
+
+def test_fresh_cache_is_not_revalidated(qapp, data_dir, monkeypatch):
+    data_dir.mkdir()
+    cache = data_dir / "font_cache.txt"
+    cache.write_text("Gammel", encoding="utf-8")
+    scans = _count_scans(monkeypatch)
+
+    assert main.pick_mono_font() == "Gammel"
+    main.refresh_mono_font_cache()
+    assert scans == []
+
+    old = time.time() - main.FONT_CACHE_MAX_AGE - 1
+    os.utime(cache, (old, old))
+    main.refresh_mono_font_cache()
+    assert scans == [1]
+    assert cache.read_text(encoding="utf-8") == "Mono"
+    assert time.time() - cache.stat().st_mtime < main.FONT_CACHE_MAX_AGE
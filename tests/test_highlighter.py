@@ -0,0 +1,30 @@
+from PyQt6 import QtGui, QtTest
+
+import main
+
+
+def _has_formats(block):
+    return bool(block.layout().formats())
+
+
+def test_lines_revealed_by_deletion_are_formatted(qapp):
+    editor = main.NoteTab("note.md")
+    editor.resize(400, 200)
+    editor.show()
+    lines = [f"linje {i}" for i in range(20)]
+    lines += ["tekst", "tekst", "# Overskrift", "tekst", "> citat"]
+    lines += [f"mere {i}" for i in range(40)]
+    editor.setPlainText("\n".join(lines))
+    QtTest.QTest.qWait(50)
+    assert editor.verticalScrollBar().value() == 0
+
+    # Slet de første 20 linjer; scrollbaren bliver stående på 0
+    cursor = QtGui.QTextCursor(editor.document())
+    cursor.movePosition(QtGui.QTextCursor.MoveOperation.Down,
+                        QtGui.QTextCursor.MoveMode.KeepAnchor, 20)
+    cursor.removeSelectedText()
+    QtTest.QTest.qWait(50)
+
+    doc = editor.document()
+    assert _has_formats(doc.findBlockByNumber(2))
+    assert _has_formats(doc.findBlockByNumber(4))
@@ -0,0 +1,36 @@
+import time
+
+from PyQt6 import QtTest, QtWidgets
+
+import main
+
+
+def test_no_timeout_after_reset(qapp):
+    window = QtWidgets.QWidget()
+    timer = main.TimerWidget(window)
+    window.show()
+    fired = []
+    timer.timeout.connect(lambda: fired.append(True))
+
+    timer.start(1)
+    timer.reset()
+    QtTest.QTest.qWait(1500)
+
+    assert not fired
+    assert not timer._timer.isActive()
+
+
+def test_does_not_finish_before_deadline(qapp):
+    window = QtWidgets.QWidget()
+    timer = main.TimerWidget(window)
+    window.show()
+    fired = []
+    timer.timeout.connect(lambda: fired.append(True))
+
+    timer.start(1)
+    timer._deadline = time.monotonic() + 0.4  # hjerteslaget tikker skævt
+    timer._refresh()
+
+    assert not fired
+    assert timer._remaining == 1
+    timer.reset()